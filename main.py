@@ -8,27 +8,323 @@ import os
 import random
 import tempfile
 import math
+import mmap
 import argparse
+import bisect
+import contextlib
 import multiprocessing as mp
-import queue
+import ctypes
+import hashlib
+import platform
+import subprocess
+import shutil
+import sys
+import threading
 from typing import Optional, Callable
 
+try:
+    from numba import njit
+    from numba.extending import overload
+except ImportError:  # numba is optional; the pure-Python loop is always available
+    njit = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional as well
+    np = None
+
 
 def _is_prime(n: int) -> bool:
-    """Check if a number is prime"""
-    if n < 2:
+    """Check if a number is prime using 6k±1 trial division"""
+    if n < 4:
+        return n > 1
+    if n % 2 == 0 or n % 3 == 0:
         return False
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
+    i = 5
+    limit = math.isqrt(n)
+    while i <= limit:
+        if n % i == 0 or n % (i + 2) == 0:
             return False
+        i += 6
     return True
 
 
 def _fibonacci(n: int) -> int:
-    """Compute Fibonacci number recursively (intentionally CPU heavy)"""
+    """Compute Fibonacci number with O(log n) fast doubling"""
+    def fib_pair(k: int):
+        # returns (F(k), F(k+1))
+        if k == 0:
+            return 0, 1
+        a, b = fib_pair(k >> 1)
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        return (d, c + d) if k & 1 else (c, d)
+
     if n <= 1:
         return n
-    return _fibonacci(n - 1) + _fibonacci(n - 2)
+    return fib_pair(n)[0]
+
+
+# fib(20) never changes between iterations, so the burn loop loads it instead
+# of calling _fibonacci once per operation.
+_FIB20 = _fibonacci(20)
+
+# Operations run between clock checks in the burn loop (and handed to a native
+# kernel per call). Larger batches amortize the clock read and the Python->native
+# call; smaller ones keep deadlines, status updates and slice boundaries precise.
+# 4096 is a few milliseconds of pure-Python work and well under one with a
+# native kernel, so the deadline overshoot stays negligible either way.
+_BURN_BATCH = 4096
+# Native kernels tried in order when --cpu-kernel is "auto", fastest first as
+# measured on the same batches: the NumPy sieve beats per-number trial division,
+# and numba's loop beats the C kernel
+_NATIVE_KERNELS = ("numpy", "numba", "c", "sieve")
+# int64 slots per worker in the multi-core shared counters (operations, primes, ready);
+# one 64-byte cache line each so workers don't contend on the same line
+_COUNTER_STRIDE = 8
+_kernels = {}  # kernel name -> warmed-up callable, or None if unavailable
+_is_prime_native = _is_prime  # replaced by the compiled version once numba loads
+
+_C_KERNEL_FLAGS = ("-O3", "-march=native", "-funroll-loops", "-shared", "-fPIC")
+# Compiled kernels are kept here between runs
+_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "perf_test")
+
+_C_KERNEL_SOURCE = r"""
+#include <math.h>
+#include <stdint.h>
+
+/* Non-short-circuit | keeps both trial divisions of a step branch-free, so the
+   compiler can issue them together and the loop carries a single exit branch. */
+static inline int is_prime(int64_t n)
+{
+    if (n < 4)
+        return n > 1;
+    if ((n % 2 == 0) | (n % 3 == 0))
+        return 0;
+    int64_t limit = (int64_t)sqrt((double)n);
+    for (int64_t i = 5; i <= limit; i += 6)
+        if (__builtin_expect((n % i == 0) | (n % (i + 2) == 0), 0))
+            return 0;
+    return 1;
+}
+
+int64_t burn(int64_t start, int64_t count, double *sink)
+{
+    int64_t primes = 0;
+    double acc = 0.0;
+    for (int64_t n = start; n < start + count; n++) {
+        primes += is_prime(n);
+        acc += sin((double)n) * cos((double)n) + sqrt((double)n);
+    }
+    *sink = acc;
+    return primes;
+}
+"""
+
+
+def _burn_kernel(start: int, count: int):
+    """Run `count` burn operations from `start`; return (primes_found, sink).
+
+    Numba-compiled counterpart of the per-operation loop in `_cpu_burn_worker`.
+    The sink accumulates the math term so it is not optimized away.
+    """
+    primes = 0
+    sink = 0.0
+    for current in range(start, start + count):
+        if _is_prime_native(current):
+            primes += 1
+        sink += math.sin(current) * math.cos(current) + math.sqrt(current)
+    return primes, sink
+
+
+def _sieve(limit: int):
+    """Return a NumPy array of all primes <= `limit` (sieve of Eratosthenes)"""
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    for i in range(2, math.isqrt(limit) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = False
+    return np.flatnonzero(is_prime)
+
+
+def _build_numpy_kernel():
+    """Build a kernel that runs each batch as NumPy array operations
+
+    Primes are counted with a segmented sieve over the batch range, and the math
+    term is evaluated for the whole batch at once.
+    """
+    if np is None:
+        return None
+    base_primes = _sieve(1 << 16)
+    # reusable float64 buffers for the vectorized math term, sized per batch;
+    # per thread, since free-threaded workers share this kernel
+    local = threading.local()
+
+    def kernel(start: int, count: int):
+        nonlocal base_primes
+        end = start + count
+        limit = math.isqrt(end - 1)
+        if base_primes[-1] < limit:
+            base_primes = _sieve(2 * limit)
+        # strike multiples of every base prime <= sqrt(end) out of [start, end)
+        segment = np.ones(count, dtype=bool)
+        if start < 2:
+            segment[:2 - start] = False
+        for p in base_primes[:np.searchsorted(base_primes, limit, side="right")].tolist():
+            first = max(p * p, -(-start // p) * p)
+            segment[first - start::p] = False
+        bufs = getattr(local, "bufs", None)
+        if bufs is None or len(bufs[0]) != count:
+            bufs = local.bufs = (np.arange(count, dtype=np.float64), np.empty(count), np.empty(count), np.empty(count))
+        offsets, vals, cos_buf, sqrt_buf = bufs
+        np.add(offsets, start, out=vals)
+        np.cos(vals, out=cos_buf)
+        np.sqrt(vals, out=sqrt_buf)
+        np.sin(vals, out=vals)
+        vals *= cos_buf
+        vals += sqrt_buf
+        return int(np.count_nonzero(segment)), float(vals.sum())
+
+    return kernel
+
+
+def _base_primes(limit: int) -> list:
+    """Return all primes <= `limit` (bytearray sieve of Eratosthenes)"""
+    flags = bytearray([1]) * (limit + 1)
+    flags[:2] = bytes(2)
+    for i in range(2, math.isqrt(limit) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return [i for i, flag in enumerate(flags) if flag]
+
+
+def _build_sieve_kernel():
+    """Build a stdlib-only kernel that counts primes per batch with a segmented sieve
+
+    Striking multiples and counting survivors are bytearray slice operations, so
+    they run at C speed without NumPy; the math term stays a Python loop.
+    """
+    base_primes = _base_primes(1 << 16)
+
+    def kernel(start: int, count: int):
+        nonlocal base_primes
+        end = start + count
+        limit = math.isqrt(end - 1)
+        if base_primes[-1] < limit:
+            base_primes = _base_primes(2 * limit)
+        segment = bytearray([1]) * count
+        if start < 2:
+            segment[:2 - start] = bytes(min(2 - start, count))
+        for p in base_primes[:bisect.bisect_right(base_primes, limit)]:
+            first = max(p * p, -(-start // p) * p)
+            segment[first - start::p] = bytes(len(range(first, end, p)))
+        sink = 0.0
+        sin, cos, sqrt = math.sin, math.cos, math.sqrt
+        for current in range(start, end):
+            sink += sin(current) * cos(current) + sqrt(current)
+        return segment.count(1), sink
+
+    return kernel
+
+
+def _build_numba_kernel():
+    """Compile `_burn_kernel` with numba"""
+    global _is_prime_native
+    if njit is None:
+        return None
+    # numba can only cache functions defined in a real file, not stdin
+    cache = os.path.isfile(globals().get("__file__", ""))
+
+    # numba has no math.isqrt; teach it one so _is_prime compiles unchanged
+    @overload(math.isqrt)
+    def _isqrt(n):
+        def impl(n):
+            r = int(math.sqrt(n))
+            # correct float rounding for large n
+            while r * r > n:
+                r -= 1
+            while (r + 1) * (r + 1) <= n:
+                r += 1
+            return r
+        return impl
+
+    # explicit int64 signatures compile eagerly here, outside any timed window,
+    # and keep numba from specializing again on other argument types. The batch
+    # touches no Python objects, so it drops the GIL; on a GIL build that lets
+    # --parallel drive tests run in another thread while it computes
+    _is_prime_native = njit("boolean(int64)", cache=cache)(_is_prime)
+    return njit("Tuple((int64, float64))(int64, int64)", cache=cache, nogil=True)(_burn_kernel)
+
+
+def _build_c_kernel():
+    """Load the C kernel from the on-disk cache, compiling `_C_KERNEL_SOURCE` with cc on a miss"""
+    cc_version = subprocess.run(["cc", "--version"], check=True, capture_output=True, timeout=30).stdout
+    # -march=native output is machine specific, so the host is part of the key too
+    key = hashlib.sha256(
+        "\0".join([_C_KERNEL_SOURCE, " ".join(_C_KERNEL_FLAGS), platform.platform(), platform.node()]).encode()
+        + cc_version
+    ).hexdigest()
+    lib_path = os.path.join(_CACHE_DIR, f"burn-{key[:16]}.so")
+    if not os.path.exists(lib_path):
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="build_", dir=_CACHE_DIR) as build_dir:
+            src_path = os.path.join(build_dir, "burn.c")
+            out_path = os.path.join(build_dir, "libburn.so")
+            with open(src_path, "w") as f:
+                f.write(_C_KERNEL_SOURCE)
+            subprocess.run(
+                ["cc", *_C_KERNEL_FLAGS, src_path, "-o", out_path, "-lm"],
+                check=True,
+                capture_output=True,
+                timeout=60,
+            )
+            # atomic, so concurrent runs never load a half-written library
+            os.replace(out_path, lib_path)
+    lib = ctypes.CDLL(lib_path)
+    burn = lib.burn
+    burn.argtypes = [ctypes.c_int64, ctypes.c_int64, ctypes.POINTER(ctypes.c_double)]
+    burn.restype = ctypes.c_int64
+
+    def kernel(start: int, count: int):
+        sink = ctypes.c_double()
+        primes = burn(start, count, ctypes.byref(sink))
+        return primes, sink.value
+
+    return kernel
+
+
+def _load_kernel(name: str):
+    """Return the warmed-up native kernel called `name`, or None if unavailable.
+
+    Building (compiling, or loading from a cache) and a warm-up call happen here,
+    so callers can trigger them outside of any timed window.
+    """
+    if name not in _kernels:
+        builder = {
+            "c": _build_c_kernel,
+            "numba": _build_numba_kernel,
+            "numpy": _build_numpy_kernel,
+            "sieve": _build_sieve_kernel,
+        }.get(name)
+        kernel = None
+        if builder is not None:
+            try:
+                kernel = builder()
+                if kernel is not None:
+                    kernel(2, 1)
+            except Exception:
+                kernel = None
+        _kernels[name] = kernel
+    return _kernels[name]
+
+
+def _resolve_kernel(preference: str = "auto") -> str:
+    """Pick the kernel to run: the preferred one if it loads, else pure Python"""
+    candidates = _NATIVE_KERNELS if preference == "auto" else (preference,)
+    for name in candidates:
+        if _load_kernel(name) is not None:
+            return name
+    return "python"
 
 
 def _cpu_burn_worker(
@@ -36,14 +332,18 @@ def _cpu_burn_worker(
     num_slices: int = 10,
     status_interval: Optional[float] = None,
     status_callback: Optional[Callable[[int, float, float], None]] = None,
-    status_queue: Optional[mp.Queue] = None,
+    counters=None,
     worker_id: Optional[int] = None,
+    kernel: str = "auto",
 ) -> dict:
     """Worker that burns CPU for approximately `duration` seconds.
 
     Returns dict with operations, primes_found, and measured duration.
+    With `counters` (a shared int64 array), publishes running operations and
+    primes_found after every batch in the `worker_id` slot (see `_COUNTER_STRIDE`).
     """
-    start_time = time.time()
+    native = _load_kernel(_resolve_kernel(kernel))
+    start_time = time.perf_counter()
     prime_count = 0
     operations = 0
     current = 2
@@ -52,55 +352,290 @@ def _cpu_burn_worker(
     slice_len = duration / len(ops_slices) if duration > 0 else 1.0
     next_cutoff = slice_len  # seconds since start
     slice_idx = 0
+    # a single slice is just the total; skip the per-batch bookkeeping for it
+    track_slices = len(ops_slices) > 1
 
     last_status_time = start_time
     last_status_ops = 0
+    slot = (worker_id or 0) * _COUNTER_STRIDE
+    # locals for the pure-Python loop: LOAD_FAST instead of global + attribute lookups
+    is_prime, sin, cos, sqrt, fib20 = _is_prime, math.sin, math.cos, math.sqrt, _FIB20
 
-    while time.time() - start_time < duration:
-        if _is_prime(current):
-            prime_count += 1
-        _ = math.sin(current) * math.cos(current) + math.sqrt(current)
-        _ = _fibonacci(20)
-        operations += 1
-        current += 1
-        if status_interval and (status_callback or status_queue is not None):
-            now = time.time()
+    while True:
+        if native is not None:
+            primes, _ = native(current, _BURN_BATCH)
+            prime_count += primes
+        else:
+            for n in range(current, current + _BURN_BATCH):
+                if is_prime(n):
+                    prime_count += 1
+                _ = sin(n) * cos(n) + sqrt(n)
+                _ = fib20
+        operations += _BURN_BATCH
+        current += _BURN_BATCH
+        if counters is not None:
+            counters[slot] = operations
+            counters[slot + 1] = prime_count
+        # Sample the clock once per batch for the deadline, status and slices
+        now = time.perf_counter()
+        elapsed = now - start_time
+        if status_interval and status_callback:
             elapsed_since_status = now - last_status_time
             if elapsed_since_status >= status_interval:
                 delta_ops = operations - last_status_ops
-                if status_callback:
-                    status_callback(delta_ops, elapsed_since_status, now - start_time)
-                if status_queue is not None:
-                    status_queue.put((worker_id, operations, now - start_time))
+                status_callback(delta_ops, elapsed_since_status, elapsed)
                 last_status_time = now
                 last_status_ops = operations
-        # Increment current slice counter, advance slice when passing cutoff
-        if slice_idx < len(ops_slices):
-            ops_slices[slice_idx] += 1
-            elapsed = time.time() - start_time
+        # Credit the batch to the current slice, advance slice when passing cutoff
+        if track_slices:
+            ops_slices[slice_idx] += _BURN_BATCH
             while elapsed >= next_cutoff and slice_idx < len(ops_slices) - 1:
                 slice_idx += 1
                 next_cutoff += slice_len
+                # restart the sequence so every slice does the same work per op,
+                # as when each slice ran as a separate call
+                current = 2
+        if elapsed >= duration:
+            break
 
-    elapsed = time.time() - start_time
+    if not track_slices:
+        ops_slices[0] = operations
     return {"operations": operations, "primes_found": prime_count, "duration": elapsed, "ops_slices": ops_slices}
 
+
+def _cpu_counter_worker(duration: float, num_slices: int, counters, durations, worker_id: int, kernel: str):
+    """Process entry point for the multi-core test; results go to shared memory"""
+    # build the kernel first (spawned workers can't inherit it), then report ready
+    _load_kernel(_resolve_kernel(kernel))
+    counters[worker_id * _COUNTER_STRIDE + 2] = 1
+    res = _cpu_burn_worker(duration, num_slices=num_slices, counters=counters, worker_id=worker_id, kernel=kernel)
+    durations[worker_id] = res["duration"]
+
+
+# Windows needs O_BINARY for raw os.open() file access; it does not exist elsewhere
+_O_BINARY = getattr(os, "O_BINARY", 0)
+# fdatasync skips the metadata flush but is missing on macOS and Windows
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+# Linux 5.14+ madvise advice; the mmap module doesn't export it (value from <linux/mman.h>)
+_MADV_POPULATE_READ = getattr(mmap, "MADV_POPULATE_READ", 22 if sys.platform.startswith("linux") else None)
+
+
+def _write_all(fd: int, data) -> None:
+    """Write all of `data` to `fd`, retrying on short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _copy_in_kernel(src: int, dst: int, count: int) -> bool:
+    """Append `count` bytes from the start of `src` to `dst` without a userspace copy"""
+    copied = 0
+    try:
+        # copy_file_range is refused across filesystems on newer kernels (EXDEV),
+        # sendfile into a regular file works on any Linux since 2.6.33
+        if hasattr(os, "copy_file_range"):
+            try:
+                while copied < count:
+                    n = os.copy_file_range(src, dst, count - copied, copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                pass
+        while copied < count:
+            n = os.sendfile(dst, src, copied, count - copied)
+            if n == 0:
+                break
+            copied += n
+    except OSError:
+        pass
+    if copied < count:
+        # roll back a partial copy so the caller can fall back to plain writes
+        os.lseek(dst, -copied, os.SEEK_CUR)
+        return False
+    return True
+
+
+def _fill_file(fd: int, size: int, data: bytes) -> None:
+    """Write `size` bytes of the repeating `data` pattern to `fd`
+
+    On Linux the pattern is staged once in a memfd and copied kernel-side, so
+    each chunk doesn't go through a user-to-kernel copy; elsewhere it is
+    written with plain writes.
+    """
+    view = memoryview(data)
+    src = -1
+    if hasattr(os, "memfd_create") and hasattr(os, "sendfile"):
+        try:
+            src = os.memfd_create("perf_test_pattern")
+            _write_all(src, view[:min(len(data), size)])
+        except OSError:
+            if src >= 0:
+                os.close(src)
+            src = -1
+    try:
+        for done in range(0, size, len(data)):
+            count = min(len(data), size - done)
+            if src >= 0:
+                if _copy_in_kernel(src, fd, count):
+                    continue
+                os.close(src)  # not supported here; stay on plain writes
+                src = -1
+            _write_all(fd, view[:count])
+    finally:
+        if src >= 0:
+            os.close(src)
+
+
+def _populate_read(fd: int, size: int) -> bool:
+    """Fault `size` bytes of `fd` in via mmap + MADV_POPULATE_READ; False if unsupported"""
+    if _MADV_POPULATE_READ is None or size == 0:
+        return False
+    with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+        try:
+            # sequential hint = aggressive readahead, then one call faults everything in
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            mm.madvise(_MADV_POPULATE_READ)
+        except OSError:
+            return False  # kernel older than 5.14
+    return True
+
+
+def _read_fully(fd: int, size: int, chunk_size: int) -> None:
+    """Read `size` bytes from `fd` without copying them into Python where possible
+
+    Tries mmap population, then sendfile to /dev/null, then plain reads.
+    """
+    if _populate_read(fd, size):
+        return
+    offset = 0
+    if hasattr(os, "sendfile"):
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            while offset < size:
+                sent = os.sendfile(devnull, fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            pass  # e.g. macOS only sends to sockets; finish with plain reads
+        finally:
+            os.close(devnull)
+    os.lseek(fd, offset, os.SEEK_SET)
+    while os.read(fd, chunk_size):
+        pass
+
+
+def _parallel_reads(fd: int, offsets: list, threads: int, direct: bool) -> float:
+    """Read 4 KiB at each offset from `threads` threads sharing `fd`; return elapsed seconds
+
+    pread/preadv don't touch the shared file position, so the reads can be in
+    flight concurrently and keep several of the drive's queues busy.
+    """
+    errors = []
+    barrier = threading.Barrier(threads + 1)
+
+    def reader(shard: list):
+        # O_DIRECT needs an aligned buffer per thread; mmap memory is page aligned
+        buf = mmap.mmap(-1, 4096) if direct else None
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            return  # the parent failed to start every reader and gave up
+        try:
+            for pos in shard:
+                if direct:
+                    os.preadv(fd, [buf], pos)
+                else:
+                    os.pread(fd, 4096, pos)
+        except OSError as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=reader, args=(offsets[i::threads],)) for i in range(threads)]
+    try:
+        for t in readers:
+            t.start()
+    except BaseException:
+        # e.g. "can't start new thread": release the readers already waiting
+        barrier.abort()
+        raise
+    # start timing once every thread is spawned and waiting
+    barrier.wait()
+    start_time = time.perf_counter()
+    for t in readers:
+        t.join()
+    elapsed = time.perf_counter() - start_time
+    if errors:
+        raise errors[0]
+    return elapsed
+
+
+def _use_free_threads() -> bool:
+    """True on a free-threaded build (Python 3.13t+) running with the GIL disabled"""
+    return hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled()
+
+
+def _open_direct(path: str) -> Optional[int]:
+    """Open `path` read/write with O_DIRECT, or return None where that is unsupported"""
+    if not hasattr(os, "O_DIRECT"):
+        return None
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_DIRECT)
+    except OSError:
+        return None
+    try:
+        # write back anything still cached, and probe that aligned I/O works here
+        os.fsync(fd)
+        os.preadv(fd, [mmap.mmap(-1, 4096)], 0)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _random_offsets(count: int, max_block: int, block_size: int = 1) -> list:
+    """Return `count` random offsets of blocks [0, max_block], generated before any timed loop"""
+    if np is not None:
+        blocks = np.random.default_rng().integers(0, max_block, size=count, dtype=np.int64, endpoint=True)
+        return (blocks * block_size).tolist()
+    return [random.randint(0, max_block) * block_size for _ in range(count)]
+
+
 class PerformanceTest:
+    # files the drive tests may leave behind in temp_dir if interrupted
+    TEST_FILES = ("sequential_test.dat", "random_test.dat")
+
     def __init__(self):
         self.results = {}
         self.temp_dir = tempfile.mkdtemp(prefix="perf_test_")
         
     def cleanup(self):
         """Clean up temporary files"""
+        for name in self.TEST_FILES:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(os.path.join(self.temp_dir, name))
         try:
-            import shutil
-            shutil.rmtree(self.temp_dir)
-        except:
-            pass
+            os.rmdir(self.temp_dir)
+        except OSError:
+            # something unexpected was left behind
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
     
-    def cpu_single_core_test(self, duration=10):
-        """Test CPU single-core performance for a fixed duration"""
+    def _select_kernel(self, preference: str) -> str:
+        """Resolve the CPU kernel, telling the user when the requested one is unavailable"""
+        name = _resolve_kernel(preference)
+        if preference not in ("auto", name):
+            print(f"   ℹ️  {preference} kernel unavailable, falling back to {name}")
+        return name
+
+    def cpu_single_core_test(self, duration=10, kernel: str = "auto", on_started: Optional[Callable[[], None]] = None):
+        """Test CPU single-core performance for a fixed duration
+
+        `on_started` is called once the kernel is ready, before timing.
+        """
         print("🔥 Testing CPU Single-Core Performance...")
+        kernel_name = self._select_kernel(kernel)
+        if on_started is not None:
+            on_started()
         slices = 10
         slice_dur = duration / slices if duration > 0 else 1.0
         ops_slices = []
@@ -112,13 +647,13 @@ class PerformanceTest:
         print("   CPU ops/sec over time:")
         # live line updated during each slice (single persistent line at bottom)
         print("   Current ops/sec: ---", end="", flush=True)
-        start_total = time.time()
+        start_total = time.perf_counter()
         for i in range(slices):
             def _update_live(delta_ops: int, delta_t: float, _total: float):
                 rate = int(delta_ops / delta_t) if delta_t > 0 else 0
                 print(f"\r\033[K   Current ops/sec: {rate:5d}", end="", flush=True)
 
-            res = _cpu_burn_worker(slice_dur, num_slices=1, status_interval=0.25, status_callback=_update_live)
+            res = _cpu_burn_worker(slice_dur, num_slices=1, status_interval=0.25, status_callback=_update_live, kernel=kernel_name)
             ops = res["operations"]
             prime = res["primes_found"]
             elapsed = res["duration"] or slice_dur
@@ -142,7 +677,7 @@ class PerformanceTest:
         print("\r\033[K", end="")
         print()
 
-        cpu_time = time.time() - start_total
+        cpu_time = time.perf_counter() - start_total
         cpu_score = int(total_ops / cpu_time) if cpu_time > 0 else 0
 
         self.results['cpu'] = {
@@ -152,6 +687,7 @@ class PerformanceTest:
             'score': cpu_score,
             'primes_found': prime_total,
             'workers': 1,
+            'kernel': kernel_name,
             'ops_slices': ops_slices,
             'slice_count': len(ops_slices),
             'planned_duration': duration
@@ -162,76 +698,85 @@ class PerformanceTest:
         print(f"   Operations performed: {total_ops}")
         print(f"   CPU Score: {cpu_score} ops/sec")
 
-    def cpu_multi_core_test(self, duration=10, workers: Optional[int] = None):
-        """Test CPU multi-core performance by running N workers in parallel."""
+    def cpu_multi_core_test(self, duration=10, workers: Optional[int] = None, kernel: str = "auto", on_started: Optional[Callable[[], None]] = None):
+        """Test CPU multi-core performance by running N workers in parallel.
+
+        `on_started` is called once all workers have been started, before timing.
+        """
         if workers is None or workers <= 0:
             workers = os.cpu_count() or 1
-        print(f"🔥 Testing CPU Multi-Core Performance with {workers} workers...")
+        free_threads = _use_free_threads()
+        kind = "free-threaded threads" if free_threads else "workers"
+        print(f"🔥 Testing CPU Multi-Core Performance with {workers} {kind}...")
+        # compile before forking so workers inherit the kernel instead of each building it
+        kernel_name = self._select_kernel(kernel)
 
         start_method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
         ctx = mp.get_context(start_method)
-        pool_factory = lambda: ctx.Pool(processes=workers)
 
         slices = 10
         slice_dur = duration / slices if duration > 0 else 1.0
-        total_ops = 0
-        total_primes = 0
-        total_wall_time = 0.0
         agg_slices = []
         last_rate = None
         bar_width = 40
         max_rate_seen = 0.0
         print("   CPU ops/sec over time:")
         print("   Current ops/sec: ---", end="", flush=True)
-        manager = ctx.Manager()
-        status_q = manager.Queue()
-        pool = pool_factory()
+        # workers free-run and publish progress in shared memory; we sample it
+        counters = ctx.RawArray('q', workers * _COUNTER_STRIDE)
+        durations = ctx.RawArray('d', workers)
+        # without a GIL, threads run in parallel and skip process startup entirely
+        worker_factory = threading.Thread if free_threads else ctx.Process
+        # workers run for exactly the parent's slices (1 s each when duration <= 0)
+        workers_list = [
+            worker_factory(
+                target=_cpu_counter_worker,
+                args=(slice_dur * slices, slices, counters, durations, w, kernel_name),
+                daemon=True,
+            )
+            for w in range(workers)
+        ]
+
+        if np is not None:
+            # zero-copy views of the shared memory, reduced in C
+            slots = np.frombuffer(counters, dtype=np.int64).reshape(workers, _COUNTER_STRIDE)
+
+            def _sample_ops() -> int:
+                return int(slots[:, 0].sum())
+        else:
+            def _sample_ops() -> int:
+                return sum(counters[w * _COUNTER_STRIDE] for w in range(workers))
 
         try:
+            for worker in workers_list:
+                worker.start()
+            if on_started is not None:
+                on_started()
+            # start the clock once every worker has its kernel ready to go
+            while not all(counters[w * _COUNTER_STRIDE + 2] for w in range(workers)):
+                if not all(worker.is_alive() for worker in workers_list):
+                    break
+                time.sleep(0.01)
+            start = time.perf_counter()
+            prev_ops = 0
+            prev_time = start
             for i in range(slices):
-                # launch workers asynchronously so we can read live updates
-                jobs = [
-                    pool.apply_async(
-                        _cpu_burn_worker,
-                        kwds={
-                            "duration": slice_dur,
-                            "num_slices": 1,
-                            "status_interval": 0.25,
-                            "status_queue": status_q,
-                            "worker_id": w,
-                        },
-                    )
-                    for w in range(workers)
-                ]
-
-                latest = {}
-                # poll queue while workers run
+                deadline = start + (i + 1) * slice_dur
                 while True:
-                    all_ready = all(j.ready() for j in jobs)
-                    drained = False
-                    while True:
-                        try:
-                            wid, ops_done, elapsed = status_q.get_nowait()
-                            latest[wid] = (ops_done, elapsed)
-                            drained = True
-                        except queue.Empty:
-                            break
-                    if drained and latest:
-                        total_ops_now = sum(v[0] for v in latest.values())
-                        max_elapsed = max(v[1] for v in latest.values())
-                        live_rate = int(total_ops_now / max_elapsed) if max_elapsed > 0 else 0
-                        print(f"\r\033[K   Current ops/sec: {live_rate:5d}", end="", flush=True)
-                    if all_ready and not drained and status_q.empty():
+                    now = time.perf_counter()
+                    # the last slice ends when every worker is done, not at the deadline
+                    if (now >= deadline if i < slices - 1 else not any(worker.is_alive() for worker in workers_list)):
                         break
-                    time.sleep(0.05)
-
-                results = [j.get() for j in jobs]
-                slice_ops = sum(r["operations"] for r in results)
-                slice_primes = sum(r["primes_found"] for r in results)
-                slice_time = max(r["duration"] for r in results) if results else slice_dur
-                total_ops += slice_ops
-                total_primes += slice_primes
-                total_wall_time += slice_time
+                    time.sleep(min(0.25, max(deadline - now, 0.05)))
+                    live_elapsed = time.perf_counter() - prev_time
+                    live_rate = int((_sample_ops() - prev_ops) / live_elapsed) if live_elapsed > 0 else 0
+                    print(f"\r\033[K   Current ops/sec: {live_rate:5d}", end="", flush=True)
+
+                ops_now = _sample_ops()
+                slice_ops = ops_now - prev_ops
+                slice_time = now - prev_time
+                prev_ops = ops_now
+                prev_time = now
                 agg_slices.append(slice_ops)
 
                 rate = slice_ops / slice_time if slice_time > 0 else 0
@@ -244,22 +789,34 @@ class PerformanceTest:
                 hi = int((i + 1) * (100 / slices))
                 bar_len = int((rate / max_rate_seen) * bar_width) if max_rate_seen > 0 else 0
                 print(f"    {i+1:02d} [{lo:02d}-{hi:02d}%] {('█' * bar_len).ljust(bar_width)} {int(rate)} ops/s")
-            if i < slices - 1:
-                shown = f"{int(last_rate):5d}" if last_rate is not None else "---"
-                print(f"   Current ops/sec: {shown}", end="", flush=True)
+                if i < slices - 1:
+                    shown = f"{int(last_rate):5d}" if last_rate is not None else "---"
+                    print(f"   Current ops/sec: {shown}", end="", flush=True)
         except KeyboardInterrupt:
-            pool.terminate()
-            pool.join()
-            manager.shutdown()
+            # threads can't be killed; as daemons they end with the interpreter
+            if not free_threads:
+                for worker in workers_list:
+                    worker.terminate()
+                for worker in workers_list:
+                    worker.join()
             raise
-        finally:
-            pool.close()
-            pool.join()
-            manager.shutdown()
+        for worker in workers_list:
+            worker.join()
+        # every worker that finished records a positive duration
+        if not all(durations):
+            raise RuntimeError("CPU worker failed")
         # clear live line after loop
         print("\r\033[K", end="")
         print()
 
+        total_ops = _sample_ops()
+        if np is not None:
+            total_primes = int(slots[:, 1].sum())
+            total_wall_time = float(np.frombuffer(durations, dtype=np.float64).max())
+        else:
+            total_primes = sum(counters[w * _COUNTER_STRIDE + 1] for w in range(workers))
+            total_wall_time = max(durations)
+
         cpu_score = int(total_ops / total_wall_time) if total_wall_time > 0 else 0
 
         self.results['cpu'] = {
@@ -269,6 +826,7 @@ class PerformanceTest:
             'score': cpu_score,
             'primes_found': total_primes,
             'workers': workers,
+            'kernel': kernel_name,
             'ops_slices': agg_slices,
             'slice_count': len(agg_slices),
             'planned_duration': duration
@@ -279,27 +837,43 @@ class PerformanceTest:
         print(f"   Total operations: {total_ops}")
         print(f"   Aggregate CPU Score: {cpu_score} ops/sec")
     
-    def drive_sequential_test(self, file_size_mb=100):
-        """Test sequential read/write performance"""
-        print("💾 Testing Drive Sequential Performance...")
+    def drive_sequential_test(self, file_size_mb=100, report: bool = True):
+        """Test sequential read/write performance
+
+        With `report` off nothing is printed; the caller shows the results later
+        with `report_sequential`.
+        """
+        if report:
+            print("💾 Testing Drive Sequential Performance...")
         
         test_file = os.path.join(self.temp_dir, "sequential_test.dat")
-        data_chunk = b'A' * (1024 * 1024)  # 1MB chunk
-        
+        chunk_mb = 8  # large writes/reads keep the syscall count low
+        data_chunk = b'A' * (chunk_mb * 1024 * 1024)
+
         # Sequential Write Test
-        start_time = time.time()
-        with open(test_file, 'wb') as f:
-            for _ in range(file_size_mb):
-                f.write(data_chunk)
-        write_time = time.time() - start_time
+        start_time = time.perf_counter()
+        fd = os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+        try:
+            _fill_file(fd, file_size_mb * 1024 * 1024, data_chunk)
+            # flush to the device so the speed reflects the drive, not the page cache
+            _fdatasync(fd)
+        finally:
+            os.close(fd)
+        write_time = time.perf_counter() - start_time
         write_speed = file_size_mb / write_time  # MB/s
-        
+
         # Sequential Read Test
-        start_time = time.time()
-        with open(test_file, 'rb') as f:
-            while f.read(1024 * 1024):
-                pass
-        read_time = time.time() - start_time
+        fd = os.open(test_file, os.O_RDONLY | _O_BINARY)
+        try:
+            # evict the (already flushed) pages we just wrote so reads hit the drive;
+            # done before the clock starts so the eviction isn't counted as read time
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            start_time = time.perf_counter()
+            _read_fully(fd, file_size_mb * 1024 * 1024, len(data_chunk))
+            read_time = time.perf_counter() - start_time
+        finally:
+            os.close(fd)
         read_speed = file_size_mb / read_time  # MB/s
         
         # Clean up
@@ -313,42 +887,100 @@ class PerformanceTest:
             'file_size_mb': file_size_mb
         }
         
-        print(f"   Sequential Write: {write_speed:.1f} MB/s")
-        print(f"   Sequential Read: {read_speed:.1f} MB/s")
+        if report:
+            self.report_sequential()
+
+    def report_sequential(self):
+        """Print the sequential drive test results"""
+        seq = self.results['sequential']
+        print(f"   Sequential Write: {seq['write_speed_mb_s']:.1f} MB/s")
+        print(f"   Sequential Read: {seq['read_speed_mb_s']:.1f} MB/s")
     
-    def drive_random_test(self, num_operations=1000):
-        """Test random read/write performance"""
-        print("🎲 Testing Drive Random Performance...")
+    def drive_random_test(self, num_operations=1000, threads: Optional[int] = None, report: bool = True):
+        """Test random read/write performance; reads are spread over `threads` threads
+
+        With `report` off nothing is printed; the caller shows the results later
+        with `report_random`.
+        """
+        if threads is None or threads <= 0:
+            threads = os.cpu_count() or 1
+        if not hasattr(os, "pread"):
+            threads = 1  # positional reads are needed to share one fd (not on Windows)
+        if report:
+            print("🎲 Testing Drive Random Performance...")
         
         # Create a test file with random data
         test_file = os.path.join(self.temp_dir, "random_test.dat")
         file_size = 50 * 1024 * 1024  # 50MB
         
-        # Create file with random data
-        with open(test_file, 'wb') as f:
-            for _ in range(50):
-                f.write(os.urandom(1024 * 1024))
-        
-        # Random Read Test
-        start_time = time.time()
-        with open(test_file, 'rb') as f:
-            for _ in range(num_operations):
-                # Random seek and read 4KB
-                pos = random.randint(0, file_size - 4096)
-                f.seek(pos)
-                f.read(4096)
-        random_read_time = time.time() - start_time
-        
-        # Random Write Test
-        start_time = time.time()
-        with open(test_file, 'r+b') as f:
-            for _ in range(num_operations):
-                # Random seek and write 4KB
-                pos = random.randint(0, file_size - 4096)
-                f.seek(pos)
-                f.write(os.urandom(4096))
-        random_write_time = time.time() - start_time
-        
+        # Create file with random data, generated and written in one go. The
+        # content is never checked, so NumPy's faster PRNG is used when available
+        # Unbuffered: the single large write goes straight to write(2)
+        with open(test_file, 'wb', buffering=0) as f:
+            # Reserve all blocks up front so the fill doesn't allocate piecemeal.
+            # The data is still written: unwritten extents read back as zeros
+            # without touching the drive, which would inflate read IOPS.
+            if hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, file_size)
+                except OSError:
+                    pass  # not supported by this filesystem
+            if np is not None:
+                _write_all(f.fileno(), np.random.default_rng().bytes(file_size))
+            else:
+                _write_all(f.fileno(), os.urandom(file_size))
+        # Payload for the write test, generated outside the timed loop
+        write_buf = os.urandom(4096)
+
+        # Prefer O_DIRECT (Linux) so the drive is measured rather than the page
+        # cache; it needs aligned buffers (mmap is page aligned) and offsets, which
+        # both paths use since unaligned 4 KiB accesses straddle two blocks
+        direct_fd = _open_direct(test_file)
+        direct = direct_fd is not None
+        if direct:
+            io_buf = mmap.mmap(-1, 4096)
+            io_buf.write(write_buf)
+        block_count = file_size // 4096
+
+        try:
+            # Random Read Test
+            offsets = _random_offsets(num_operations, block_count - 1, 4096)
+            if direct:
+                random_read_time = _parallel_reads(direct_fd, offsets, threads, direct=True)
+            elif threads > 1:
+                read_fd = os.open(test_file, os.O_RDONLY | _O_BINARY)
+                try:
+                    random_read_time = _parallel_reads(read_fd, offsets, threads, direct=False)
+                finally:
+                    os.close(read_fd)
+            else:
+                start_time = time.perf_counter()
+                # unbuffered, so each seek+read is exactly one 4 KiB read(2)
+                # rather than a BufferedReader refill
+                with open(test_file, 'rb', buffering=0) as f:
+                    for pos in offsets:
+                        # Random seek and read 4KB
+                        f.seek(pos)
+                        f.read(4096)
+                random_read_time = time.perf_counter() - start_time
+
+            # Random Write Test
+            offsets = _random_offsets(num_operations, block_count - 1, 4096)
+            start_time = time.perf_counter()
+            if direct:
+                for pos in offsets:
+                    os.pwritev(direct_fd, [io_buf], pos)
+            else:
+                with open(test_file, 'r+b', buffering=0) as f:
+                    for pos in offsets:
+                        # Random seek and write 4KB
+                        f.seek(pos)
+                        f.write(write_buf)
+            random_write_time = time.perf_counter() - start_time
+        finally:
+            if direct:
+                os.close(direct_fd)
+
         # Calculate IOPS (Input/Output Operations Per Second)
         read_iops = num_operations / random_read_time
         write_iops = num_operations / random_write_time
@@ -361,11 +993,21 @@ class PerformanceTest:
             'write_time': random_write_time,
             'read_iops': read_iops,
             'write_iops': write_iops,
-            'operations': num_operations
+            'operations': num_operations,
+            'direct_io': direct,
+            'read_threads': threads
         }
-        
-        print(f"   Random Read: {read_iops:.0f} IOPS")
-        print(f"   Random Write: {write_iops:.0f} IOPS")
+
+        if report:
+            self.report_random()
+
+    def report_random(self):
+        """Print the random drive test results"""
+        rand = self.results['random']
+        if rand['direct_io']:
+            print("   Using O_DIRECT (page cache bypassed)")
+        print(f"   Random Read: {rand['read_iops']:.0f} IOPS ({rand['read_threads']} thread(s))")
+        print(f"   Random Write: {rand['write_iops']:.0f} IOPS")
     
     def calculate_drive_score(self):
         """Calculate overall drive performance score as composite metric"""
@@ -382,39 +1024,73 @@ class PerformanceTest:
         
         return drive_score
     
-    def run_all_tests(self, cpu_mode: str = 'single', cpu_duration: int = 10, cpu_workers: Optional[int] = None, skip_drive: bool = True):
-        """Run all performance tests"""
+    def run_all_tests(self, cpu_mode: str = 'single', cpu_duration: int = 10, cpu_workers: Optional[int] = None, skip_drive: bool = True, cpu_kernel: str = 'auto', drive_threads: Optional[int] = None, parallel: bool = False):
+        """Run all performance tests
+
+        With `parallel`, the drive tests run in a background thread while the CPU
+        test runs, so the suite takes about as long as the longer of the two. They
+        run silently and are reported once the CPU test has finished, so the two
+        don't garble each other's output.
+        """
         print("🚀 Starting PC Performance Test Suite")
         print("=" * 50)
 
         if skip_drive:
             print("ℹ️  Drive tests skipped (enable with --with-drive)")
             print()
+        parallel = parallel and not skip_drive
+
+        drive_errors = []
+        def _background_drive_tests():
+            try:
+                self.drive_sequential_test(report=False)
+                self.drive_random_test(threads=drive_threads, report=False)
+            except BaseException as e:
+                drive_errors.append(e)
 
         try:
-            # CPU Test
+            # Drive Tests (optional), overlapping the CPU test with --parallel
+            drive_thread = None
+            if parallel:
+                print("ℹ️  Running drive tests concurrently with the CPU test (--parallel)")
+                print()
+                drive_thread = threading.Thread(target=_background_drive_tests, daemon=True)
+
+            # CPU Test. The drive thread starts only once the kernel is built (so
+            # compiling it doesn't overlap the drive measurements) and, in multi
+            # mode, every worker process exists: forking with the drive thread
+            # running could leave workers holding its locks
+            on_started = drive_thread.start if drive_thread is not None else None
             if cpu_mode == 'multi':
-                self.cpu_multi_core_test(duration=cpu_duration, workers=cpu_workers)
+                self.cpu_multi_core_test(duration=cpu_duration, workers=cpu_workers, kernel=cpu_kernel, on_started=on_started)
             else:
-                self.cpu_single_core_test(duration=cpu_duration)
+                self.cpu_single_core_test(duration=cpu_duration, kernel=cpu_kernel, on_started=on_started)
             print()
+            self.results['cpu']['concurrent_drive'] = parallel
             
-            # Drive Tests (optional)
-            if not skip_drive:
+            if drive_thread is not None:
+                drive_thread.join()
+                if drive_errors:
+                    raise drive_errors[0]
+                print("💾 Drive Sequential Performance (measured during the CPU test)")
+                self.report_sequential()
+                print()
+
+                print("🎲 Drive Random Performance (measured during the CPU test)")
+                self.report_random()
+                print()
+            elif not skip_drive:
                 self.drive_sequential_test()
                 print()
                 
-                self.drive_random_test()
+                self.drive_random_test(threads=drive_threads)
                 print()
             
-            # Calculate scores
+            # Calculate scores. They are reported separately: the CPU score
+            # depends on the kernel and is orders of magnitude above the drive
+            # composite, so an average of the two would just be CPU/2
             cpu_score = self.results['cpu']['score']
-            if not skip_drive:
-                drive_score = self.calculate_drive_score()
-                overall_score = int((cpu_score + drive_score) / 2)
-            else:
-                drive_score = None
-                overall_score = cpu_score
+            drive_score = self.calculate_drive_score() if not skip_drive else None
             
             # Detailed breakdown
             print("📋 DETAILED BREAKDOWN")
@@ -426,9 +1102,12 @@ class PerformanceTest:
             
             print(f"CPU Tests:")
             print(f"  • Mode: {cpu['mode']} ({cpu['workers']} worker(s))")
+            print(f"  • Kernel: {cpu['kernel']}")
             print(f"  • Duration: {cpu['duration']:.2f}s")
             print(f"  • Operations: {cpu['operations']}")
             print(f"  • Primes found: {cpu['primes_found']}")
+            if cpu['concurrent_drive']:
+                print(f"  • Ran concurrently with the drive tests (not comparable to sequential runs)")
             
             if not skip_drive:
                 print(f"Drive Tests:")
@@ -441,12 +1120,9 @@ class PerformanceTest:
             # Display final results
             print("📊 PERFORMANCE RESULTS")
             print("=" * 50)
-            print(f"CPU Performance Score:    {cpu_score:8d} ops/sec")
+            print(f"CPU Performance Score:    {cpu_score:8d} ops/sec ({cpu['kernel']} kernel)")
             if not skip_drive:
                 print(f"Drive Performance Score:  {drive_score:8d} composite")
-                print(f"Overall Performance Score: {overall_score:8d} combined")
-            else:
-                print(f"Overall Performance Score: {overall_score:8d} (CPU only)")
             
         except KeyboardInterrupt:
             print("\n⚠️  Test interrupted by user")
@@ -461,13 +1137,16 @@ def main():
     parser.add_argument("--cpu-mode", choices=["single", "multi"], default="single", help="CPU test mode")
     parser.add_argument("--cpu-duration", type=int, default=10, help="CPU test duration in seconds")
     parser.add_argument("--cpu-workers", type=int, default=None, help="Number of workers for multi-core test (default: CPU count)")
+    parser.add_argument("--cpu-kernel", choices=["auto", *_NATIVE_KERNELS, "python"], default="auto", help="CPU burn kernel (default: first available of numpy, numba, c, sieve)")
 
     parser.add_argument("--with-drive", dest="skip_drive", action="store_false", help="Include drive tests (default is CPU-only)")
+    parser.add_argument("--drive-threads", type=int, default=None, help="Threads issuing random reads in the drive test (default: CPU count)")
+    parser.add_argument("--parallel", action="store_true", help="Run the drive tests concurrently with the CPU test (needs --with-drive)")
     parser.set_defaults(skip_drive=True)
     args = parser.parse_args()
 
     test = PerformanceTest()
-    test.run_all_tests(cpu_mode=args.cpu_mode, cpu_duration=args.cpu_duration, cpu_workers=args.cpu_workers, skip_drive=args.skip_drive)
+    test.run_all_tests(cpu_mode=args.cpu_mode, cpu_duration=args.cpu_duration, cpu_workers=args.cpu_workers, skip_drive=args.skip_drive, cpu_kernel=args.cpu_kernel, drive_threads=args.drive_threads, parallel=args.parallel)
 
 if __name__ == "__main__":
     main()
@@ -1,31 +1,90 @@
 """
-Windows entry point: fetches the main suite script to a temp file and runs it,
-so multiprocessing works even when invoked via a piped one-liner. The temp file
-is deleted after execution.
+Windows entry point: fetches the main suite script to a file and runs it from
+there in-process, so multiprocessing works even when invoked via a piped
+one-liner. The script is cached under ~/.cache/perf_test and only re-downloaded
+when its ETag changes. Set PERF_TEST_SHA256 to pin the expected SHA-256 of
+main.py: a matching cached copy is then used without any network access, and a
+mismatch refuses to run.
 """
 
+import gzip
+import hashlib
 import os
-import subprocess
+import runpy
 import sys
 import tempfile
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 
 MAIN_URL = "https://raw.githubusercontent.com/AndreiMarhatau/perf-test/main/main.py"
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "perf_test")
+CACHE_PATH = os.path.join(CACHE_DIR, "main.py")
+ETAG_PATH = CACHE_PATH + ".etag"
 
 
-def run():
-    fd, temp_path = tempfile.mkstemp(prefix="perf_test_main_", suffix=".py")
-    try:
-        with os.fdopen(fd, "wb") as tmp:
-            tmp.write(urlopen(MAIN_URL).read())
+def _sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
 
-        result = subprocess.run([sys.executable, temp_path] + sys.argv[1:])
-        sys.exit(result.returncode)
-    finally:
+
+def _download(headers, dest):
+    """Stream MAIN_URL into the file object `dest`; return (sha256 hex digest, ETag)"""
+    digest = hashlib.sha256()
+    with urlopen(Request(MAIN_URL, headers={**headers, "Accept-Encoding": "gzip"})) as resp:
+        src = gzip.GzipFile(fileobj=resp) if resp.headers.get("Content-Encoding") == "gzip" else resp
+        while True:
+            chunk = src.read(64 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dest.write(chunk)
+        return digest.hexdigest(), resp.headers.get("ETag")
+
+
+def _fetch_main(pinned_sha256=None):
+    """Return the path of an up-to-date copy of main.py, downloading only if it changed"""
+    if pinned_sha256 and os.path.exists(CACHE_PATH) and _sha256(CACHE_PATH) == pinned_sha256:
+        return CACHE_PATH
+    headers = {}
+    # a pinned hash the cache doesn't match needs the full body, never a 304
+    if not pinned_sha256 and os.path.exists(CACHE_PATH) and os.path.exists(ETAG_PATH):
+        with open(ETAG_PATH) as f:
+            headers["If-None-Match"] = f.read().strip()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix="main_", suffix=".py", dir=CACHE_DIR)
+    try:
         try:
+            with os.fdopen(fd, "wb") as tmp:
+                digest, etag = _download(headers, tmp)
+        except URLError as e:
+            if isinstance(e, HTTPError) and e.code == 304:
+                return CACHE_PATH
+            # offline or a server error (5xx, 429, ...): fall back to the last
+            # downloaded copy if there is one
+            if os.path.exists(CACHE_PATH) and not pinned_sha256:
+                return CACHE_PATH
+            raise
+        if pinned_sha256 and digest != pinned_sha256:
+            raise RuntimeError(f"Downloaded main.py does not match PERF_TEST_SHA256={pinned_sha256}")
+        os.replace(temp_path, CACHE_PATH)
+    finally:
+        if os.path.exists(temp_path):
             os.remove(temp_path)
-        except OSError:
-            pass
+    if etag:
+        with open(ETAG_PATH, "w") as f:
+            f.write(etag)
+    elif os.path.exists(ETAG_PATH):
+        os.remove(ETAG_PATH)
+    return CACHE_PATH
+
+
+def run():
+    pinned = os.environ.get("PERF_TEST_SHA256", "").strip().lower() or None
+    main_path = _fetch_main(pinned)
+    # run in this interpreter; __main__ is backed by the cached file, so
+    # multiprocessing's spawn can still re-import it in child processes
+    sys.argv = [main_path] + sys.argv[1:]
+    runpy.run_path(main_path, run_name="__main__")
 
 
 if __name__ == "__main__":